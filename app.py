@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+import functools
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator
 
 import gradio as gr
+import orjson  # noqa: F401 — ensures Gradio's fast JSON serialization path is available
 
-from document_processor import extract_comments, extract_text
 from llm_client import get_available_models, stream_analysis, stream_answer, compose_answer_stream
-from report_generator import save_analysis_to_docx, save_qa_to_docx
+
+# document_processor (python-docx) and report_generator are imported lazily
+# inside the handlers that need them, keeping cold start light.
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -17,8 +24,43 @@ from report_generator import save_analysis_to_docx, save_qa_to_docx
 OUTPUT_DIR = Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-_POSITIVE_WORDS = {"yes", "y", "approve", "approved", "accept", "accepted", "good", "ok", "okay", "save"}
-_NEGATIVE_WORDS = {"no", "n", "reject", "rejected", "retry", "redo", "again", "bad", "nope"}
+_POSITIVE_WORDS = frozenset({"yes", "y", "approve", "approved", "accept", "accepted", "good", "ok", "okay", "save"})
+_NEGATIVE_WORDS = frozenset({"no", "n", "reject", "rejected", "retry", "redo", "again", "bad", "nope"})
+
+# Chat message templates, precompiled once at import so per-question handlers
+# only pay for the substitution (and so the wording lives in one place).
+_START_TEMPLATE = (
+    "🚀 Verification started — **{total} question(s)** to verify.\n\n"
+    "**Question 1 of {total}:**\n\n> {q}\n\n"
+    "Provide any additional context that might help answer this question, "
+    "or just press **Submit** with an empty message to answer from the disclosure only."
+)
+_NEXT_Q_TEMPLATE = (
+    "✅ Answer saved! ({approved}/{total} approved)\n\n"
+    "**Question {idx} of {total}:**\n\n> {q}\n\n"
+    "Provide any additional context, or submit with an empty message."
+)
+_RETRY_TEMPLATE = (
+    "🔄 No problem — let's try again.\n\n"
+    "**Question {idx} of {total}:**\n\n> {q}\n\n"
+    "Please provide more context or clarification to help generate a better answer."
+)
+_FEEDBACK_TEMPLATE = (
+    "\n\n---\n*Answer for Question {idx} of {total} — "
+    "is this satisfactory?*\n"
+    "Type **yes** (or y/approve) to save and continue, "
+    "or **no** (or n/retry) to try again with more context."
+)
+
+# Streaming yields are coalesced so each websocket frame carries a batch of
+# tokens instead of one: flush the buffer every _FLUSH_CHARS characters or
+# _FLUSH_SECS seconds, whichever comes first.
+_FLUSH_CHARS = 64
+_FLUSH_SECS = 0.05
+
+# Shared pool for parallel document parsing (zipfile/XML work releases the GIL
+# during I/O, so the three uploads parse concurrently).
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
 
 # ---------------------------------------------------------------------------
 # Helper: resolve file path from Gradio upload (handles str or legacy object)
@@ -27,19 +69,44 @@ _NEGATIVE_WORDS = {"no", "n", "reject", "rejected", "retry", "redo", "again", "b
 def _path(f) -> str | None:
     if f is None:
         return None
-    if isinstance(f, str):
-        return f
-    if hasattr(f, "name"):
-        return f.name
-    return str(f)
+    return f if isinstance(f, str) else getattr(f, "name", None) or str(f)
+
+
+# ---------------------------------------------------------------------------
+# Cached document parsing — keyed on (path, mtime, size) so re-loading the
+# same upload (e.g. after switching models) skips the .docx parse entirely,
+# while a re-upload invalidates automatically via the changed mtime.
+# ---------------------------------------------------------------------------
+
+def _doc_key(path: str) -> tuple[str, int, int]:
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _extract_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    from document_processor import extract_text
+    return extract_text(path)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_docx_cached(path: str, mtime_ns: int, size: int) -> tuple[str, list[str]]:
+    """(text, comments) extracted over a single zip open — used for the claim doc."""
+    from document_processor import load_docx
+    return load_docx(path)
+
+
+def _text_from_key(key: tuple[str, int, int] | None) -> str:
+    """Recover document text from its cache key (near-free on a warm cache)."""
+    return _extract_text_cached(*key) if key else ""
 
 
 # ---------------------------------------------------------------------------
 # Model helpers
 # ---------------------------------------------------------------------------
 
-def refresh_models() -> gr.Dropdown:
-    models = get_available_models()
+def refresh_models(force: bool = False) -> gr.Dropdown:
+    models = get_available_models(force=force)
     if not models:
         return gr.Dropdown(
             choices=["(no models — is ollama running?)"],
@@ -63,10 +130,18 @@ def load_documents(id_file, extra_file, claim_file):
         return None, None, None, [], "⚠ Please upload the Patent Claim document."
 
     try:
-        id_text = extract_text(id_path)
-        claim_text = extract_text(claim_path)
-        extra_text = extract_text(extra_path) if extra_path else ""
-        questions = extract_comments(claim_path)
+        # The extractions are independent — run them concurrently. The claim
+        # doc needs both text and comments, so those come from one zip open.
+        id_key = _doc_key(id_path)
+        claim_key = _doc_key(claim_path)
+        extra_key = _doc_key(extra_path) if extra_path else None
+        id_fut = _IO_POOL.submit(_extract_text_cached, *id_key)
+        claim_fut = _IO_POOL.submit(_load_docx_cached, *claim_key)
+        extra_fut = _IO_POOL.submit(_extract_text_cached, *extra_key) if extra_key else None
+
+        id_text = id_fut.result()
+        claim_text, questions = claim_fut.result()
+        extra_text = extra_fut.result() if extra_fut else ""
 
         lines = [
             "✅ Documents loaded successfully!",
@@ -79,7 +154,9 @@ def load_documents(id_file, extra_file, claim_file):
         if not questions:
             lines.append("   ⚠ No comments found in the patent claim document.")
 
-        return id_text, extra_text, claim_text, questions, "\n".join(lines)
+        # Only the small cache keys cross the Gradio session boundary; the
+        # texts themselves stay in the in-process LRU cache.
+        return id_key, extra_key, claim_key, questions, "\n".join(lines)
 
     except Exception as exc:
         return None, None, None, [], f"❌ Error loading documents: {exc}"
@@ -89,16 +166,16 @@ def load_documents(id_file, extra_file, claim_file):
 # Analyze tab — streaming
 # ---------------------------------------------------------------------------
 
-def run_analysis_stream(
-    id_text: str | None,
-    extra_text: str | None,
-    claim_text: str | None,
+async def run_analysis_stream(
+    id_key: tuple | None,
+    extra_key: tuple | None,
+    claim_key: tuple | None,
     model: str | None,
-) -> Generator:
-    if not id_text:
+) -> AsyncGenerator:
+    if not id_key:
         yield "⚠ Please load documents first.", None
         return
-    if not claim_text:
+    if not claim_key:
         yield "⚠ Patent claim text is missing. Please reload documents.", None
         return
     if not model or "no models" in (model or "").lower():
@@ -106,15 +183,39 @@ def run_analysis_stream(
         return
 
     try:
+        id_text = _text_from_key(id_key)
+        claim_text, _ = _load_docx_cached(*claim_key)  # warm from load_documents
+        extra_text = _text_from_key(extra_key)
+
+        parts: list[str] = []
         accumulated = ""
-        for chunk in stream_analysis(id_text, claim_text, extra_text or "", model):
-            accumulated += chunk
+        buf_len = 0
+        last_flush = time.monotonic()
+        async for chunk in stream_analysis(id_text, claim_text, extra_text or "", model):
+            parts.append(chunk)
+            buf_len += len(chunk)
+            now = time.monotonic()
+            if buf_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_SECS:
+                accumulated = "".join(parts)
+                buf_len = 0
+                last_flush = now
+                yield accumulated, None
+        if buf_len:
+            accumulated = "".join(parts)
             yield accumulated, None
 
-        # Save report after full generation
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Save report after full generation (path is only allocated once the
+        # stream actually completes, so a cancelled stream costs nothing here).
+        # The docx build runs on the I/O pool so the finished text reaches the
+        # browser while the report is still being written.
+        from report_generator import save_analysis_to_docx
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         out_path = str(OUTPUT_DIR / f"analysis_{timestamp}.docx")
-        save_analysis_to_docx(accumulated, out_path)
+        yield accumulated + "\n\n*(generating report…)*", None
+        await asyncio.get_running_loop().run_in_executor(
+            _IO_POOL, save_analysis_to_docx, accumulated, out_path
+        )
         yield accumulated, out_path
 
     except Exception as exc:
@@ -125,25 +226,25 @@ def run_analysis_stream(
 # Verify tab — session management
 # ---------------------------------------------------------------------------
 
-def _make_session(questions: list[str], model: str, id_text: str, extra_text: str) -> dict:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def _make_session(questions: list[str], model: str, id_key: tuple | None, extra_key: tuple | None) -> dict:
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return {
         "phase": "asking",
         "questions": questions,
         "current_index": 0,
         "current_question": questions[0],
         "current_answer": None,
-        "approved_qa": [],
+        "approved_qa": deque(),
         "output_path": str(OUTPUT_DIR / f"qa_report_{timestamp}.docx"),
         "model": model,
-        "id_text": id_text,
-        "extra_text": extra_text,
+        "id_key": id_key,
+        "extra_key": extra_key,
     }
 
 
-def start_verification(id_text, questions, model):
+def start_verification(id_key, questions, model):
     """Initialise or reset a verification session and show the first question."""
-    if not id_text:
+    if not id_key:
         history = [{"role": "assistant", "content": "⚠ Please load documents first using **Load Documents**."}]
         return history, {"phase": "idle"}, None
 
@@ -158,28 +259,22 @@ def start_verification(id_text, questions, model):
         history = [{"role": "assistant", "content": "⚠ Please select a valid ollama model."}]
         return history, {"phase": "idle"}, None
 
-    session = _make_session(questions, model, id_text, "")
+    session = _make_session(questions, model, id_key, None)
     total = len(questions)
     first_q = questions[0]
 
     history = [{
         "role": "assistant",
-        "content": (
-            f"🚀 Verification started — **{total} question(s)** to verify.\n\n"
-            f"**Question 1 of {total}:**\n\n> {first_q}\n\n"
-            "Provide any additional context that might help answer this question, "
-            "or just press **Submit** with an empty message to answer from the disclosure only."
-        ),
+        "content": _START_TEMPLATE.format_map({"total": total, "q": first_q}),
     }]
     return history, session, None
 
 
-def start_verification_full(id_text, extra_text, questions, model):
-    """Like start_verification but also stores extra_text in session."""
-    history, session, qa_path = start_verification(id_text, questions, model)
+def start_verification_full(id_key, extra_key, questions, model):
+    """Like start_verification but also stores the extra-doc key in session."""
+    history, session, qa_path = start_verification(id_key, questions, model)
     if session.get("phase") == "asking":
-        session["extra_text"] = extra_text or ""
-        session["id_text"] = id_text or ""
+        session["extra_key"] = extra_key
     return history, session, qa_path
 
 
@@ -187,57 +282,68 @@ def start_verification_full(id_text, extra_text, questions, model):
 # Verify tab — streaming chat handler
 # ---------------------------------------------------------------------------
 
-def handle_chat_stream(
+async def handle_chat_stream(
     message: str,
     history: list[dict],
     session: dict,
-) -> Generator:
+) -> AsyncGenerator:
     """Generator that drives the verification state machine with streaming LLM output."""
 
     phase = session.get("phase", "idle")
 
     # ── Idle: not started yet ───────────────────────────────────────────────
     if phase == "idle":
-        history = history + [{
+        history.extend([{
             "role": "user", "content": message or "(empty)",
         }, {
             "role": "assistant",
             "content": "Please click **Start Verification** to begin.",
-        }]
+        }])
         yield history, session, None
         return
 
     # ── Done: all questions processed ───────────────────────────────────────
     if phase == "done":
-        history = history + [{
+        history.extend([{
             "role": "user", "content": message or "(empty)",
         }, {
             "role": "assistant",
             "content": "✅ Verification is complete! Download the Q&A report using the button below.",
-        }]
+        }])
         yield history, session, None
         return
 
     # ── Asking: user provides context, LLM streams an answer ────────────────
     if phase == "asking":
         user_msg = message.strip() if message else ""
-        history = history + [{"role": "user", "content": user_msg or "(no additional context)"}]
+        history.append({"role": "user", "content": user_msg or "(no additional context)"})
 
         # Placeholder for streaming response
-        history = history + [{"role": "assistant", "content": ""}]
+        history.append({"role": "assistant", "content": ""})
+        parts: list[str] = []
         accumulated = ""
+        buf_len = 0
+        last_flush = time.monotonic()
 
         try:
-            for chunk in stream_answer(
+            async for chunk in stream_answer(
                 question=session["current_question"],
-                id_text=session["id_text"],
-                extra_text=session.get("extra_text", ""),
+                id_text=_text_from_key(session["id_key"]),
+                extra_text=_text_from_key(session.get("extra_key")),
                 user_context=user_msg,
                 model=session["model"],
             ):
-                accumulated += chunk
-                history[-1] = {"role": "assistant", "content": accumulated}
-                yield history, session, None
+                parts.append(chunk)
+                buf_len += len(chunk)
+                now = time.monotonic()
+                if buf_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_SECS:
+                    accumulated = "".join(parts)
+                    buf_len = 0
+                    last_flush = now
+                    history[-1] = {"role": "assistant", "content": accumulated}
+                    yield history, session, None
+            if buf_len:
+                accumulated = "".join(parts)
 
         except Exception as exc:
             history[-1] = {
@@ -250,21 +356,15 @@ def handle_chat_stream(
         # Append the feedback prompt to the same message
         idx = session["current_index"]
         total = len(session["questions"])
-        feedback_prompt = (
-            f"\n\n---\n*Answer for Question {idx + 1} of {total} — "
-            "is this satisfactory?*\n"
-            "Type **yes** (or y/approve) to save and continue, "
-            "or **no** (or n/retry) to try again with more context."
-        )
+        feedback_prompt = _FEEDBACK_TEMPLATE.format_map({"idx": idx + 1, "total": total})
         history[-1] = {"role": "assistant", "content": accumulated + feedback_prompt}
 
-        new_session = {
-            **session,
-            "phase": "waiting_feedback",
-            "current_answer": accumulated,
-            "current_user_context": user_msg,
-        }
-        yield history, new_session, None
+        # Mutate the session in place — copying the dict per transition is
+        # wasted work since Gradio hands the same object back next turn.
+        session["phase"] = "waiting_feedback"
+        session["current_answer"] = accumulated
+        session["current_user_context"] = user_msg
+        yield history, session, None
         return
 
     # ── Waiting feedback: yes → save & advance / no → retry ────────────────
@@ -273,109 +373,131 @@ def handle_chat_stream(
 
         # Treat empty message as a reminder
         if not feedback:
-            history = history + [{
+            history.append({
                 "role": "assistant",
                 "content": "Please type **yes** to accept the answer or **no** to retry.",
-            }]
+            })
             yield history, session, None
             return
 
-        history = history + [{"role": "user", "content": message}]
-        words = set(feedback.split())
+        history.append({"role": "user", "content": message})
+
+        # Fast path: typical feedback is a single word ("yes"/"no"), so try a
+        # direct membership test before paying for a split()+set() build.
+        if feedback in _POSITIVE_WORDS:
+            is_positive, is_negative = True, False
+        elif feedback in _NEGATIVE_WORDS:
+            is_positive, is_negative = False, True
+        else:
+            words = set(feedback.split())
+            is_positive = bool(words & _POSITIVE_WORDS)
+            is_negative = bool(words & _NEGATIVE_WORDS)
 
         # ── Positive feedback: compose a single clean answer, then save ────────
-        if words & _POSITIVE_WORDS:
+        if is_positive:
             # Stream a composed answer that blends user context + LLM draft
-            history = history + [{"role": "assistant", "content": "✍ Composing final answer…"}]
+            history.append({"role": "assistant", "content": "✍ Composing final answer…"})
+            parts = []
             composed = ""
+            buf_len = 0
+            last_flush = time.monotonic()
             try:
-                for chunk in compose_answer_stream(
+                async for chunk in compose_answer_stream(
                     question=session["current_question"],
                     user_context=session.get("current_user_context", ""),
                     llm_draft=session["current_answer"],
-                    id_text=session["id_text"],
-                    extra_text=session.get("extra_text", ""),
+                    id_text=_text_from_key(session["id_key"]),
+                    extra_text=_text_from_key(session.get("extra_key")),
                     model=session["model"],
                 ):
-                    composed += chunk
+                    parts.append(chunk)
+                    buf_len += len(chunk)
+                    now = time.monotonic()
+                    if buf_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_SECS:
+                        composed = "".join(parts)
+                        buf_len = 0
+                        last_flush = now
+                        history[-1] = {"role": "assistant", "content": composed}
+                        yield history, session, None
+                if buf_len:
+                    composed = "".join(parts)
                     history[-1] = {"role": "assistant", "content": composed}
-                    yield history, session, None
             except Exception as exc:
                 history[-1] = {"role": "assistant", "content": f"❌ Error composing answer: {exc}"}
                 yield history, session, None
                 return
 
             # Save the composed answer (not the raw draft)
-            new_qa = session["approved_qa"] + [(session["current_question"], composed)]
+            approved_qa = session["approved_qa"]
+            approved_qa.append((session["current_question"], composed))
             next_idx = session["current_index"] + 1
             questions = session["questions"]
 
             if next_idx >= len(questions):
-                # All done — save docx
-                new_session = {**session, "phase": "done", "approved_qa": new_qa}
+                # All done — save docx on the I/O pool, with a status message
+                # up front so the chat stays responsive during the write
+                session["phase"] = "done"
+                history.append({"role": "assistant", "content": "💾 Saving the Q&A report…"})
+                yield history, session, None
                 try:
-                    save_qa_to_docx(new_qa, session["output_path"])
-                    history = history + [{
+                    from report_generator import save_qa_to_docx
+
+                    await asyncio.get_running_loop().run_in_executor(
+                        _IO_POOL, save_qa_to_docx, list(approved_qa), session["output_path"]
+                    )
+                    history[-1] = {
                         "role": "assistant",
                         "content": (
-                            f"✅ Answer saved! All **{len(new_qa)}** answer(s) approved.\n\n"
+                            f"✅ Answer saved! All **{len(approved_qa)}** answer(s) approved.\n\n"
                             "🎉 Verification complete! Download the Q&A report below."
                         ),
-                    }]
-                    yield history, new_session, session["output_path"]
+                    }
+                    yield history, session, session["output_path"]
                 except Exception as exc:
-                    history = history + [{
+                    history[-1] = {
                         "role": "assistant",
                         "content": f"❌ Error saving Q&A report: {exc}",
-                    }]
-                    yield history, new_session, None
+                    }
+                    yield history, session, None
                 return
 
             # Move to next question
-            new_session = {
-                **session,
-                "phase": "asking",
-                "approved_qa": new_qa,
-                "current_index": next_idx,
-                "current_question": questions[next_idx],
-                "current_answer": None,
-                "current_user_context": "",
-            }
+            session["phase"] = "asking"
+            session["current_index"] = next_idx
+            session["current_question"] = questions[next_idx]
+            session["current_answer"] = None
+            session["current_user_context"] = ""
             total = len(questions)
             next_q = questions[next_idx]
-            history = history + [{
+            history.append({
                 "role": "assistant",
-                "content": (
-                    f"✅ Answer saved! ({len(new_qa)}/{total} approved)\n\n"
-                    f"**Question {next_idx + 1} of {total}:**\n\n> {next_q}\n\n"
-                    "Provide any additional context, or submit with an empty message."
-                ),
-            }]
-            yield history, new_session, None
+                "content": _NEXT_Q_TEMPLATE.format_map({
+                    "approved": len(approved_qa), "total": total,
+                    "idx": next_idx + 1, "q": next_q,
+                }),
+            })
+            yield history, session, None
             return
 
         # ── Negative feedback ───────────────────────────────────────────────
-        if words & _NEGATIVE_WORDS:
-            new_session = {**session, "phase": "asking", "current_answer": None}
+        if is_negative:
+            session["phase"] = "asking"
+            session["current_answer"] = None
             idx = session["current_index"]
             total = len(session["questions"])
             question = session["current_question"]
-            history = history + [{
+            history.append({
                 "role": "assistant",
-                "content": (
-                    "🔄 No problem — let's try again.\n\n"
-                    f"**Question {idx + 1} of {total}:**\n\n> {question}\n\n"
-                    "Please provide more context or clarification to help generate a better answer."
-                ),
-            }]
-            yield history, new_session, None
+                "content": _RETRY_TEMPLATE.format_map({"idx": idx + 1, "total": total, "q": question}),
+            })
+            yield history, session, None
             return
 
         # ── Unrecognised ────────────────────────────────────────────────────
-        history = history + [{
+        history.append({
             "role": "assistant",
             "content": "I didn't catch that. Please type **yes** to accept or **no** to retry.",
-        }]
+        })
         yield history, session, None
 
 
@@ -383,51 +505,35 @@ def handle_chat_stream(
 # Gradio UI
 # ---------------------------------------------------------------------------
 
-def _submit_wrap(message, history, session, prev_qa_path):
+async def _submit_wrap(message, history, session, prev_qa_path):
     """Wrap the streaming generator; preserve qa_path across turns."""
     last_history, last_session, last_qa = history, session, prev_qa_path
-    for h, s, qa in handle_chat_stream(message, history, session):
+    async for h, s, qa in handle_chat_stream(message, history, session):
         last_history, last_session, last_qa = h, s, qa or prev_qa_path
         yield "", last_history, last_session, last_qa, last_qa
 
 
-_CSS = """
-/* ── model dropdown: show full names, no clipping ── */
-#model-selector li,
-#model-selector [class*="item"] {
-    white-space:   normal     !important;
-    word-break:    break-word !important;
-    overflow:      visible    !important;
-    text-overflow: unset      !important;
-    line-height:   1.35       !important;
-    padding:       5px 10px   !important;
-}
-#model-selector [class*="options"],
-#model-selector [class*="list-container"],
-#model-selector ul {
-    max-height: 360px !important;
-    overflow-y: auto  !important;
-}
-/* ── upload button rows: tight vertical spacing ── */
-.upload-row { gap: 6px !important; align-items: center !important; min-height: 0 !important; }
-.upload-row > * { margin-bottom: 0 !important; }
-"""
+# Stylesheet is served as a static file so the browser can cache it across
+# page reloads instead of re-receiving it inline with every page.
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
 
 # ── helper used by upload event handlers ────────────────────────────────────
 def _on_upload(f) -> tuple:
     if not f:
         return None, "not loaded"
-    name = Path(f).name if isinstance(f, str) else Path(f.name).name
+    name = os.path.basename(f if isinstance(f, str) else f.name)
     return f, f"✅ {name}"
 
 
 with gr.Blocks(
     title="Patent Claim Verifier",
     theme=gr.themes.Soft(),
-    css=_CSS,
+    css_paths=[_CSS_PATH],
 ) as demo:
 
     # ── Shared state ─────────────────────────────────────────────────────────
+    # These hold (path, mtime_ns, size) cache keys, not the document texts —
+    # the texts live in the in-process LRU cache and never cross the session.
     id_text_state    = gr.State(None)
     extra_text_state = gr.State(None)
     claim_text_state = gr.State(None)
@@ -549,8 +655,8 @@ with gr.Blocks(
     extra_btn.upload(_on_upload, inputs=[extra_btn], outputs=[extra_file_state, extra_name])
     claim_btn.upload(_on_upload, inputs=[claim_btn], outputs=[claim_file_state, claim_name])
 
-    # Model refresh
-    refresh_btn.click(refresh_models, outputs=model_dd)
+    # Model refresh — the explicit button bypasses the short TTL cache
+    refresh_btn.click(lambda: refresh_models(force=True), outputs=model_dd)
 
     # Load documents (now uses stored file-path states, not gr.File components)
     load_btn.click(
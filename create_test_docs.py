@@ -8,10 +8,16 @@ Generate three dummy .docx test files for the patent claim verifier:
 Run:  python create_test_docs.py
 """
 import os
+import shutil
+import warnings
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from xml.sax.saxutils import escape
 
 OUT = Path(__file__).parent
 INVENTION = "Smart Water Bottle with IoT Temperature & Hydration Monitoring"
@@ -28,6 +34,29 @@ def p(doc, text):
 def b(doc, text):
     doc.add_paragraph(text, style="List Bullet")
 
+def t(doc, rows):
+    """Append a Table Grid table built as one XML parse instead of per-cell
+    python-docx writes (each .cell().text assignment walks the tree anew)."""
+    rows_xml = "".join(
+        "<w:tr>" + "".join(
+            f'<w:tc><w:p><w:r><w:t xml:space="preserve">{escape(cell)}</w:t></w:r></w:p></w:tc>'
+            for cell in row
+        ) + "</w:tr>"
+        for row in rows
+    )
+    cols_xml = '<w:gridCol w:w="3000"/>' * len(rows[0])
+    tbl_el = parse_xml(
+        f"<w:tbl {nsdecls('w')}>"
+        '<w:tblPr><w:tblStyle w:val="TableGrid"/></w:tblPr>'
+        f"<w:tblGrid>{cols_xml}</w:tblGrid>{rows_xml}</w:tbl>"
+    )
+    body = doc.element.body
+    sect_pr = body.find(qn("w:sectPr"))
+    if sect_pr is not None:
+        sect_pr.addprevious(tbl_el)
+    else:
+        body.append(tbl_el)
+
 
 # ── 1. Invention Disclosure ───────────────────────────────────────────────────
 
@@ -114,11 +143,7 @@ def make_additional():
         ("Battery life",         "16 days",   "≥ 14 days"),
         ("Water-resistance",     "IP67 pass", "IP67"),
     ]
-    tbl = doc.add_table(rows=len(rows), cols=3)
-    tbl.style = "Table Grid"
-    for r_idx, row_data in enumerate(rows):
-        for c_idx, cell_text in enumerate(row_data):
-            tbl.cell(r_idx, c_idx).text = cell_text
+    t(doc, rows)
 
     h(doc, "B. Manufacturing Notes")
     p(doc, (
@@ -198,30 +223,77 @@ _REL_ENTRY = (
 )
 
 
+# Appending duplicate members relies on zip readers taking the last entry for
+# a given name (Word and Python's zipfile both do). Flip to False to fall back
+# to the full-rewrite path if a consumer chokes on duplicates.
+_APPEND_INJECT = True
+
+
 def _inject_comments(docx_path: str):
     """Patch an existing .docx ZIP to add word/comments.xml and register it."""
+    if _APPEND_INJECT:
+        _inject_comments_append(docx_path)
+    else:
+        _inject_comments_rewrite(docx_path)
+
+
+def _inject_comments_append(docx_path: str):
+    """Append comments.xml plus patched registration entries to the zip.
+
+    Avoids copying the whole archive: cost is O(patched bytes), not O(file).
+    """
+    with zipfile.ZipFile(docx_path, "r") as zin:
+        ct = zin.read("[Content_Types].xml").decode("utf-8")
+        rels = zin.read("word/_rels/document.xml.rels").decode("utf-8")
+
+    if "comments.xml" not in ct:
+        ct = ct.replace("</Types>", _CT_OVERRIDE + "\n</Types>")
+    if "comments" not in rels.lower():
+        rels = rels.replace("</Relationships>", _REL_ENTRY + "\n</Relationships>")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # zipfile warns about duplicate names
+        with zipfile.ZipFile(docx_path, "a", zipfile.ZIP_DEFLATED, allowZip64=True) as zout:
+            # ~1 KB of XML — deflate buys nothing here, skip the CPU.
+            comments_info = zipfile.ZipInfo("word/comments.xml")
+            comments_info.compress_type = zipfile.ZIP_STORED
+            zout.writestr(comments_info, _COMMENTS_XML.encode("utf-8"))
+            zout.writestr("[Content_Types].xml", ct.encode("utf-8"))
+            zout.writestr("word/_rels/document.xml.rels", rels.encode("utf-8"))
+
+
+def _inject_comments_rewrite(docx_path: str, compresslevel: int | None = None):
+    """Rebuild the .docx ZIP with word/comments.xml added and registered.
+
+    ``compresslevel=1`` trades a slightly larger file for much less deflate
+    CPU when output size doesn't matter.
+    """
     tmp = docx_path + ".tmp"
     with zipfile.ZipFile(docx_path, "r") as zin, \
-         zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zout:
+         zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zout:
 
         for item in zin.infolist():
-            data = zin.read(item.filename)
-
             if item.filename == "[Content_Types].xml":
-                text = data.decode("utf-8")
+                text = zin.read(item.filename).decode("utf-8")
                 if "comments.xml" not in text:
                     text = text.replace("</Types>", _CT_OVERRIDE + "\n</Types>")
-                data = text.encode("utf-8")
+                zout.writestr(item, text.encode("utf-8"))
 
             elif item.filename == "word/_rels/document.xml.rels":
-                text = data.decode("utf-8")
+                text = zin.read(item.filename).decode("utf-8")
                 if "comments" not in text.lower():
                     text = text.replace("</Relationships>", _REL_ENTRY + "\n</Relationships>")
-                data = text.encode("utf-8")
+                zout.writestr(item, text.encode("utf-8"))
 
-            zout.writestr(item, data)
+            else:
+                # Untouched members stream through in 64 KiB chunks instead
+                # of being materialized as whole bytes objects.
+                with zin.open(item) as src, zout.open(item, "w") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 16)
 
-        zout.writestr("word/comments.xml", _COMMENTS_XML.encode("utf-8"))
+        comments_info = zipfile.ZipInfo("word/comments.xml")
+        comments_info.compress_type = zipfile.ZIP_STORED
+        zout.writestr(comments_info, _COMMENTS_XML.encode("utf-8"))
 
     os.replace(tmp, docx_path)
 
@@ -291,8 +363,16 @@ def make_claim():
 
 # ── entry point ───────────────────────────────────────────────────────────────
 
+_GENERATORS = {"id": make_id, "additional": make_additional, "claim": make_claim}
+
+
+def _dispatch(name: str) -> None:
+    _GENERATORS[name]()
+
+
 if __name__ == "__main__":
-    make_id()
-    make_additional()
-    make_claim()
+    # The three generators are independent and python-docx is CPU-bound, so
+    # build them in separate processes rather than sequentially.
+    with ProcessPoolExecutor(max_workers=3) as ex:
+        list(ex.map(_dispatch, ["id", "additional", "claim"]))
     print("\nAll three test documents created.")
@@ -1,32 +1,94 @@
+import functools
 import zipfile
-import xml.etree.ElementTree as ET
+
 from docx import Document
+from lxml import etree
 
 _W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-_NS = {"w": _W_NS}
+
+# Fully-qualified tag names, built once at import so hot loops compare
+# against interned strings instead of re-resolving namespace prefixes.
+_COMMENT_TAG = f"{{{_W_NS}}}comment"
+_T_TAG = f"{{{_W_NS}}}t"
+_P_TAG = f"{{{_W_NS}}}p"
+_R_TAG = f"{{{_W_NS}}}r"
+_BR_TAG = f"{{{_W_NS}}}br"
+_CR_TAG = f"{{{_W_NS}}}cr"
+_TAB_TAG = f"{{{_W_NS}}}tab"
 
 
 def extract_text(docx_path: str) -> str:
     """Extract all plain text from a .docx file (paragraphs + table cells)."""
-    doc = Document(docx_path)
-    parts: list[str] = []
+    try:
+        with zipfile.ZipFile(docx_path) as z, z.open("word/document.xml") as f:
+            return _text_from_document_xml(f)
+    except Exception as exc:
+        print(f"[document_processor] Fast text extraction failed ({exc}); using python-docx")
+        return _extract_text_docx(docx_path)
 
-    for para in doc.paragraphs:
-        text = para.text.strip()
-        if text:
-            parts.append(text)
 
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    text = para.text.strip()
-                    if text:
-                        parts.append(text)
+def _text_from_document_xml(f) -> str:
+    """Single streaming pass over document.xml.
 
+    Collects w:t text in document order and emits one line per non-empty
+    w:p — table cell paragraphs included — without ever building the
+    python-docx object graph. Soft line breaks (w:br/w:cr) and run tabs
+    render as "\n"/"\t", matching python-docx's paragraph text.
+    """
+    parts: list[str] = []
+    buf: list[str] = []
+    for _event, elem in etree.iterparse(f, events=("end",)):
+        tag = elem.tag
+        if tag == _T_TAG:
+            if elem.text:
+                buf.append(elem.text)
+        elif tag == _BR_TAG or tag == _CR_TAG:
+            buf.append("\n")
+        elif tag == _TAB_TAG:
+            # Only run-level tabs; w:tab also names tab-stop definitions
+            # under w:pPr/w:tabs, which carry no text.
+            if elem.getparent().tag == _R_TAG:
+                buf.append("\t")
+        elif tag == _P_TAG:
+            text = "".join(buf).strip()
+            if text:
+                parts.append(text)
+            buf.clear()
+            elem.clear()
     return "\n".join(parts)
 
 
+def _extract_text_docx(docx_path: str) -> str:
+    """Fallback text extraction via the python-docx object model."""
+    doc = Document(docx_path)
+    raws = [para.text for para in doc.paragraphs]
+    raws += [
+        para.text
+        for table in doc.tables
+        for row in table.rows
+        for cell in row.cells
+        for para in cell.paragraphs
+    ]
+    # Strip each paragraph once and drop empties in one filter pass.
+    return "\n".join(filter(None, (raw.strip() for raw in raws)))
+
+
+def _comments_from_xml(f) -> list[str]:
+    """Stream-parse comments.xml with lxml (libxml2's C parser).
+
+    iterparse hands us each completed w:comment, itertext() collects its runs
+    in C, and clearing the element keeps peak memory at one comment rather
+    than the whole tree.
+    """
+    comments: list[str] = []
+    for _event, comment_el in etree.iterparse(f, events=("end",), tag=_COMMENT_TAG):
+        text = " ".join(comment_el.itertext()).strip()
+        if text:
+            comments.append(text)
+        comment_el.clear(keep_tail=True)
+    return comments
+
+
 def extract_comments(docx_path: str) -> list[str]:
     """Extract all comment texts from a .docx file (used as verification questions)."""
     comments: list[str] = []
@@ -35,17 +97,53 @@ def extract_comments(docx_path: str) -> list[str]:
         with zipfile.ZipFile(docx_path) as z:
             if "word/comments.xml" not in z.namelist():
                 return comments
-
             with z.open("word/comments.xml") as f:
-                root = ET.parse(f).getroot()
-
-            for comment_el in root.findall(".//w:comment", _NS):
-                text_nodes = comment_el.findall(".//w:t", _NS)
-                text = " ".join(t.text for t in text_nodes if t.text).strip()
-                if text:
-                    comments.append(text)
+                comments = _comments_from_xml(f)
 
     except Exception as exc:
         print(f"[document_processor] Comment extraction failed: {exc}")
 
     return comments
+
+
+class DocxExtractor:
+    """Extracts text and comments from one .docx over a single zip handle.
+
+    Opening the archive (and scanning its central directory) happens once,
+    however many parts are read; ``text`` and ``comments`` are parsed lazily
+    and cached.
+    """
+
+    def __init__(self, docx_path: str):
+        self._zip = zipfile.ZipFile(docx_path)
+
+    @functools.cached_property
+    def text(self) -> str:
+        with self._zip.open("word/document.xml") as f:
+            return _text_from_document_xml(f)
+
+    @functools.cached_property
+    def comments(self) -> list[str]:
+        if "word/comments.xml" not in self._zip.namelist():
+            return []
+        with self._zip.open("word/comments.xml") as f:
+            return _comments_from_xml(f)
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "DocxExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_docx(docx_path: str) -> tuple[str, list[str]]:
+    """Extract (text, comments) from a .docx with one zip open instead of two."""
+    try:
+        with DocxExtractor(docx_path) as extractor:
+            return extractor.text, extractor.comments
+    except Exception as exc:
+        print(f"[document_processor] Combined extraction failed ({exc}); reopening per part")
+        return extract_text(docx_path), extract_comments(docx_path)
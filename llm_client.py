@@ -1,25 +1,76 @@
-from typing import Generator
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator
+
+import httpx
 import ollama
 
+# Shared clients so every Ollama call reuses one kept-alive connection pool
+# instead of paying TCP setup per request. Generations can run for minutes,
+# hence the long read timeout with a short connect timeout.
+_HTTPX_KWARGS = dict(
+    timeout=httpx.Timeout(300.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=40, keepalive_expiry=30.0),
+)
+_CLIENT = ollama.Client(**_HTTPX_KWARGS)
+_ASYNC_CLIENT = ollama.AsyncClient(**_HTTPX_KWARGS)
+
+
+# Bounded LRU of generated answers so accidentally resubmitting the same
+# question/context replays instantly instead of re-running the generation.
+_ANSWER_CACHE_MAX = 32
+_answer_cache: OrderedDict[bytes, str] = OrderedDict()
+
+
+def _answer_cache_key(*fields: str) -> bytes:
+    return hashlib.blake2b("\0".join(fields).encode(), digest_size=16).digest()
+
+
+# Short TTL cache so simultaneous page loads don't hammer /api/tags. The TTL
+# is an lru_cache keyed on a coarse monotonic time bucket: within one bucket
+# every caller hits the cached entry, and the rollover to the next bucket is
+# the expiry.
+_MODELS_TTL_SECS = 5.0
 
-def get_available_models() -> list[str]:
-    """Return names of locally available ollama models."""
+
+def _models_bucket() -> int:
+    return int(time.monotonic() // _MODELS_TTL_SECS)
+
+
+@functools.lru_cache(maxsize=2)
+def _list_models(_bucket: int) -> list[str]:
     try:
-        response = ollama.list()
+        response = _CLIENT.list()
         # Handle both new object API and legacy dict API
         if hasattr(response, "models"):
-            return [m.model for m in response.models if m.model]
-        if isinstance(response, dict):
-            return [
+            models = [m.model for m in response.models if m.model]
+        elif isinstance(response, dict):
+            models = [
                 m.get("name", m.get("model", ""))
                 for m in response.get("models", [])
                 if m.get("name") or m.get("model")
             ]
+        else:
+            models = []
+        return models
     except Exception as exc:
         print(f"[llm_client] Could not list ollama models: {exc}")
     return []
 
 
+def get_available_models(force: bool = False) -> list[str]:
+    """Return names of locally available ollama models.
+
+    Results are cached for a few seconds; pass ``force=True`` (the refresh
+    button) to bypass the cache.
+    """
+    if force:
+        _list_models.cache_clear()
+    return _list_models(_models_bucket())
+
+
 def _chunk_content(chunk) -> str:
     """Extract text content from an ollama streaming chunk."""
     if hasattr(chunk, "message"):
@@ -27,22 +78,19 @@ def _chunk_content(chunk) -> str:
     return chunk.get("message", {}).get("content", "")
 
 
-def stream_analysis(
-    id_text: str,
-    claim_text: str,
-    extra_text: str,
-    model: str,
-) -> Generator[str, None, None]:
-    """Stream a comparative analysis between the Invention Disclosure and Patent Claims."""
-    extra_section = f"\n\n## Additional Information\n{extra_text}" if extra_text.strip() else ""
-
-    prompt = f"""You are a senior patent expert. Carefully compare the Invention Disclosure with the Patent Claims below and produce a structured analysis report.
+# Constant prompt fragments, interned once at import; per-call prompts are a
+# single join of these with the dynamic document texts.
+_ANALYSIS_HEAD = """You are a senior patent expert. Carefully compare the Invention Disclosure with the Patent Claims below and produce a structured analysis report.
 
 ## Invention Disclosure
-{id_text}{extra_section}
+"""
+
+_ANALYSIS_CLAIMS_HDR = """
 
 ## Patent Claims
-{claim_text}
+"""
+
+_ANALYSIS_TAIL = """
 
 ---
 
@@ -65,42 +113,95 @@ Note any inconsistencies, mismatches, or contradictions between the disclosure a
 
 Be specific; reference exact claim language and disclosure sections where relevant."""
 
-    stream = ollama.chat(
+_ANSWER_SYS_HEAD = """You are a patent expert helping to verify patent claims against an Invention Disclosure.
+
+Invention Disclosure Document:
+---
+"""
+
+_ANSWER_SYS_TAIL = """
+---
+
+Your task is to answer questions about the patent claims based solely on the invention disclosure above. Be precise, specific, and cite relevant parts of the disclosure where applicable."""
+
+
+# Ollama chunks are typically 1-10 tokens; coalescing them amortizes the
+# generator-resume and downstream-render cost per yield, like buffered I/O.
+_FLUSH_SIZE = 256
+
+
+async def _coalesced(stream, flush_size: int) -> AsyncGenerator[str, None]:
+    """Batch tiny token chunks; flush on newline or at flush_size characters."""
+    buf: list[str] = []
+    buf_len = 0
+    async for chunk in stream:
+        content = _chunk_content(chunk)
+        if not content:
+            continue
+        buf.append(content)
+        buf_len += len(content)
+        if buf_len >= flush_size or "\n" in content:
+            yield "".join(buf)
+            buf.clear()
+            buf_len = 0
+    if buf:
+        yield "".join(buf)
+
+
+async def stream_analysis(
+    id_text: str,
+    claim_text: str,
+    extra_text: str,
+    model: str,
+    flush_size: int = _FLUSH_SIZE,
+) -> AsyncGenerator[str, None]:
+    """Stream a comparative analysis between the Invention Disclosure and Patent Claims."""
+    extra_section = f"\n\n## Additional Information\n{extra_text}" if extra_text.strip() else ""
+
+    prompt = "".join([
+        _ANALYSIS_HEAD, id_text, extra_section,
+        _ANALYSIS_CLAIMS_HDR, claim_text, _ANALYSIS_TAIL,
+    ])
+
+    stream = await _ASYNC_CLIENT.chat(
         model=model,
         messages=[{"role": "user", "content": prompt}],
         stream=True,
     )
-    for chunk in stream:
-        content = _chunk_content(chunk)
-        if content:
-            yield content
+    async for piece in _coalesced(stream, flush_size):
+        yield piece
 
 
-def stream_answer(
+async def stream_answer(
     question: str,
     id_text: str,
     extra_text: str,
     user_context: str,
     model: str,
-) -> Generator[str, None, None]:
+    flush_size: int = _FLUSH_SIZE,
+) -> AsyncGenerator[str, None]:
     """Stream an answer to a patent claim question using the ID document as context."""
     extra_section = f"\n\nAdditional Information:\n{extra_text}" if extra_text.strip() else ""
 
-    system_content = f"""You are a patent expert helping to verify patent claims against an Invention Disclosure.
-
-Invention Disclosure Document:
----
-{id_text}{extra_section}
----
-
-Your task is to answer questions about the patent claims based solely on the invention disclosure above. Be precise, specific, and cite relevant parts of the disclosure where applicable."""
+    system_content = "".join([_ANSWER_SYS_HEAD, id_text, extra_section, _ANSWER_SYS_TAIL])
 
     user_content = f"Question to answer:\n{question}"
     if user_context.strip():
         user_content += f"\n\nAdditional context provided by reviewer:\n{user_context}"
     user_content += "\n\nPlease provide a thorough, well-structured answer."
 
-    stream = ollama.chat(
+    cache_key = _answer_cache_key(question, id_text, extra_text, user_context, model)
+    cached = _answer_cache.get(cache_key)
+    if cached is not None:
+        _answer_cache.move_to_end(cache_key)
+        # Replay in a handful of chunks to preserve the streaming feel.
+        step = max(1, len(cached) // 5)
+        for start in range(0, len(cached), step):
+            yield cached[start:start + step]
+        return
+
+    parts: list[str] = []
+    stream = await _ASYNC_CLIENT.chat(
         model=model,
         messages=[
             {"role": "system", "content": system_content},
@@ -108,20 +209,24 @@ Your task is to answer questions about the patent claims based solely on the inv
         ],
         stream=True,
     )
-    for chunk in stream:
-        content = _chunk_content(chunk)
-        if content:
-            yield content
+    async for piece in _coalesced(stream, flush_size):
+        parts.append(piece)
+        yield piece
+
+    _answer_cache[cache_key] = "".join(parts)
+    if len(_answer_cache) > _ANSWER_CACHE_MAX:
+        _answer_cache.popitem(last=False)
 
 
-def compose_answer_stream(
+async def compose_answer_stream(
     question: str,
     user_context: str,
     llm_draft: str,
     id_text: str,
     extra_text: str,
     model: str,
-) -> Generator[str, None, None]:
+    flush_size: int = _FLUSH_SIZE,
+) -> AsyncGenerator[str, None]:
     """Stream a single composed final answer that blends reviewer context and LLM draft."""
     extra = f"\n\nAdditional Information:\n{extra_text}" if extra_text.strip() else ""
     user_part = f"\n\nContext provided by reviewer:\n{user_context}" if user_context.strip() else ""
@@ -140,12 +245,10 @@ Draft analysis:
 
 Write a single, well-structured answer that naturally integrates all the relevant information above. Present it as a standalone professional answer — do not reference "the reviewer", "the draft", or "the context" explicitly. Just write the final answer."""
 
-    stream = ollama.chat(
+    stream = await _ASYNC_CLIENT.chat(
         model=model,
         messages=[{"role": "user", "content": prompt}],
         stream=True,
     )
-    for chunk in stream:
-        content = _chunk_content(chunk)
-        if content:
-            yield content
+    async for piece in _coalesced(stream, flush_size):
+        yield piece
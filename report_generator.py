@@ -1,10 +1,48 @@
+import io
+import re
 from datetime import datetime
+from xml.sax.saxutils import escape
+
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt, RGBColor
 
+_W_DECL = nsdecls("w")
+
+# One precompiled match replaces the chain of startswith/isdigit probes when
+# classifying a markdown line: group 1 is the marker (heading hashes, bullet,
+# or numbered-list prefix), group 2 the payload.
+_LINE_RE = re.compile(r"^(#{1,3}|[-*•]|\d+\.) (.*)$")
+
+# Quick probe for any markdown at all in a block of text (line markers after
+# optional leading whitespace, or inline bold). Answers that are plain prose —
+# the common case — skip the line-by-line parse entirely.
+_MD_RE = re.compile(r"(?m)^\s*(#{1,3}|[-*•]|\d+\.) |\*\*")
+
+# Hoisted loop invariants for the report writers.
+_DIVIDER = "─" * 60
+_CENTER = WD_ALIGN_PARAGRAPH.CENTER
+
 
-def _add_markdown_paragraph(doc: Document, line: str) -> None:
+def _doc_styles(doc: Document) -> dict[str, object]:
+    """Resolve the markdown target styles once per document.
+
+    Passing a style object to add_paragraph skips the per-call name lookup
+    (and add_heading's style-name formatting) inside the conversion loop.
+    """
+    styles = doc.styles
+    return {
+        "#": styles["Heading 1"],
+        "##": styles["Heading 2"],
+        "###": styles["Heading 3"],
+        "bullet": styles["List Bullet"],
+        "number": styles["List Number"],
+    }
+
+
+def _add_markdown_paragraph(doc: Document, line: str, styles: dict[str, object]) -> None:
     """Add a single line to the document with basic markdown-to-docx conversion."""
     stripped = line.strip()
 
@@ -12,25 +50,15 @@ def _add_markdown_paragraph(doc: Document, line: str) -> None:
         doc.add_paragraph()
         return
 
-    # Heading levels
-    if stripped.startswith("### "):
-        doc.add_heading(stripped[4:], level=3)
-        return
-    if stripped.startswith("## "):
-        doc.add_heading(stripped[3:], level=2)
-        return
-    if stripped.startswith("# "):
-        doc.add_heading(stripped[2:], level=1)
-        return
-
-    # Bullet list
-    if stripped.startswith(("- ", "* ", "• ")):
-        doc.add_paragraph(stripped[2:], style="List Bullet")
-        return
-
-    # Numbered list (e.g. "1. ")
-    if len(stripped) > 2 and stripped[0].isdigit() and stripped[1] == "." and stripped[2] == " ":
-        doc.add_paragraph(stripped[3:], style="List Number")
+    match = _LINE_RE.match(stripped)
+    if match:
+        marker, payload = match.groups()
+        if marker[0] == "#":
+            doc.add_paragraph(payload, style=styles[marker])
+        elif marker[0].isdigit():
+            doc.add_paragraph(payload, style=styles["number"])
+        else:
+            doc.add_paragraph(payload, style=styles["bullet"])
         return
 
     # Plain paragraph (handle inline **bold**)
@@ -38,70 +66,157 @@ def _add_markdown_paragraph(doc: Document, line: str) -> None:
     _add_inline_bold(para, stripped)
 
 
+def _runs_xml(text: str) -> str:
+    """Render text (with optional **bold** markers) as w:r XML."""
+    if "**" not in text:
+        return f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+    runs = []
+    for i, part in enumerate(text.split("**")):
+        if not part:
+            continue
+        props = "<w:rPr><w:b/></w:rPr>" if i % 2 == 1 else ""
+        runs.append(f'<w:r>{props}<w:t xml:space="preserve">{escape(part)}</w:t></w:r>')
+    return "".join(runs)
+
+
+def _styled_p_xml(style_id: str, text: str) -> str:
+    return f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>{_runs_xml(text)}</w:p>'
+
+
+def _line_to_xml(line: str) -> str:
+    """XML equivalent of _add_markdown_paragraph for the bulk-append path."""
+    stripped = line.strip()
+
+    if not stripped:
+        return "<w:p/>"
+
+    match = _LINE_RE.match(stripped)
+    if match:
+        marker, payload = match.groups()
+        if marker[0] == "#":
+            return _styled_p_xml(f"Heading{len(marker)}", payload)
+        if marker[0].isdigit():
+            return _styled_p_xml("ListNumber", payload)
+        return _styled_p_xml("ListBullet", payload)
+
+    return f"<w:p>{_runs_xml(stripped)}</w:p>"
+
+
+def _append_markdown_block(doc: Document, text: str) -> None:
+    """Append a whole markdown block as one XML splice.
+
+    Per-line add_paragraph/add_run calls each mutate (and revalidate) the
+    element tree; building the w:p elements as strings and parsing them in a
+    single batch turns n tree mutations into one parse plus n raw inserts.
+    """
+    block = "".join(_line_to_xml(line) for line in text.splitlines())
+    fragment = parse_xml(f"<w:body {_W_DECL}>{block}</w:body>")
+    body = doc.element.body
+    sect_pr = body.find(qn("w:sectPr"))
+    for child in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(child)
+        else:
+            body.append(child)
+
+
 def _add_inline_bold(para, text: str) -> None:
     """Split text on **…** markers and add runs with bold toggled."""
-    parts = text.split("**")
-    for i, part in enumerate(parts):
+    # Nearly all lines carry no bold markers — skip the split entirely.
+    if "**" not in text:
+        para.add_run(text)
+        return
+    for i, part in enumerate(text.split("**")):
+        if not part:
+            continue
         run = para.add_run(part)
         run.bold = (i % 2 == 1)
 
 
-def save_analysis_to_docx(analysis_text: str, output_path: str) -> str:
-    """Save the streaming analysis text to a formatted .docx file."""
+def _write_docx(doc: Document, output_path: str) -> None:
+    """Serialize to memory first, then write the file in one buffered pass.
+
+    doc.save(path) zips directly onto the file handle, issuing many small
+    writes; staging the archive in a BytesIO and flushing it with a single
+    large-buffered write keeps the on-disk I/O to one burst.
+    """
+    buf = io.BytesIO()
+    doc.save(buf)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(buf.getbuffer())
+
+
+def _build_analysis_doc(analysis_text: str) -> Document:
     doc = Document()
 
     title = doc.add_heading("Patent Claim Analysis Report", 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title.alignment = _CENTER
 
     meta = doc.add_paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    meta.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    meta.alignment = _CENTER
 
     doc.add_paragraph()
 
-    for line in analysis_text.splitlines():
-        _add_markdown_paragraph(doc, line)
+    _append_markdown_block(doc, analysis_text)
+    return doc
 
-    doc.save(output_path)
+
+def save_analysis_to_docx(analysis_text: str, output_path: str) -> str:
+    """Save the streaming analysis text to a formatted .docx file."""
+    _write_docx(_build_analysis_doc(analysis_text), output_path)
     return output_path
 
 
+def save_analysis_to_stream(analysis_text: str, fileobj) -> None:
+    """Write the formatted analysis report to an open binary file object."""
+    _build_analysis_doc(analysis_text).save(fileobj)
+
+
 def save_qa_to_docx(qa_pairs: list[tuple[str, str]], output_path: str) -> str:
     """Save approved Q&A pairs to a formatted .docx file."""
     doc = Document()
 
     title = doc.add_heading("Patent Claim Verification — Q&A Report", 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title.alignment = _CENTER
 
     meta = doc.add_paragraph(
         f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  |  "
         f"Total approved pairs: {len(qa_pairs)}"
     )
-    meta.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    meta.alignment = _CENTER
     doc.add_paragraph()
 
+    # Bind the hot bound methods once (LOAD_FAST instead of LOAD_ATTR per call)
+    add_paragraph = doc.add_paragraph
+    add_heading = doc.add_heading
+    styles = _doc_styles(doc)
+
     for i, (question, answer) in enumerate(qa_pairs, 1):
         # Question heading
-        doc.add_heading(f"Question {i}", level=2)
+        add_heading(f"Question {i}", level=2)
 
-        q_para = doc.add_paragraph()
+        q_para = add_paragraph()
         q_run = q_para.add_run("Q: ")
         q_run.bold = True
         q_run.font.color.rgb = RGBColor(0x1F, 0x49, 0x7D)
         q_para.add_run(question)
 
-        doc.add_paragraph()
+        add_paragraph()
 
-        a_heading = doc.add_paragraph()
+        a_heading = add_paragraph()
         a_run = a_heading.add_run("Answer:")
         a_run.bold = True
 
-        for line in answer.splitlines():
-            _add_markdown_paragraph(doc, line)
+        if _MD_RE.search(answer):
+            for line in answer.splitlines():
+                _add_markdown_paragraph(doc, line, styles)
+        else:
+            add_paragraph(answer)
 
         # Divider
-        doc.add_paragraph()
-        doc.add_paragraph("─" * 60)
-        doc.add_paragraph()
+        add_paragraph()
+        add_paragraph(_DIVIDER)
+        add_paragraph()
 
-    doc.save(output_path)
+    _write_docx(doc, output_path)
     return output_path